@@ -1,5 +1,5 @@
 import streamlit as st
-from scraper import scrape_to_csv
+from vc_scraper import BrowserHost, extract_companies, to_csv_bytes
 
 st.set_page_config(page_title="VC Portfolio Scraper", page_icon="🕸️")
 
@@ -27,13 +27,28 @@ st.markdown(
 
 
 
+@st.cache_resource
+def get_browser() -> BrowserHost:
+    # One Chromium for the whole app instead of a cold start per scrape
+    return BrowserHost()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_scrape(url: str) -> bytes:
+    # Re-clicking "Scrape" for the same URL shouldn't re-run the whole pipeline.
+    # No rows usually means a transient failure (the scraper swallows errors), so
+    # raise instead: Streamlit doesn't cache exceptions, and the next click retries
+    rows = extract_companies(url, browser=get_browser())
+    if not rows:
+        raise RuntimeError("No companies found on that page; try again in a moment.")
+    return to_csv_bytes(rows)
+
 st.title("Rho VC Portfolio Scraper")
 
 url = st.text_input("Paste a VC portfolio URL:")
 if st.button("Scrape") and url:
     with st.spinner("Scraping…"):
         try:
-            csv_bytes = scrape_to_csv(url)
+            csv_bytes = cached_scrape(url)
             st.success("Done! Download below ⬇️")
             st.download_button("📥 Download CSV",
                                data=csv_bytes,
@@ -41,3 +56,7 @@ if st.button("Scrape") and url:
                                mime="text/csv")
         except Exception as e:
             st.error(f"Error: {e}")
+
+if st.button("Clear cache"):
+    cached_scrape.clear()
+    st.info("Cached results cleared.")
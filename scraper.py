@@ -1,8 +1,4 @@
-from vc_scraper import extract_companies
-import csv, io
+from vc_scraper import extract_companies, to_csv_bytes
 
-def scrape_to_csv(url: str) -> bytes:
-    rows = extract_companies(url)
-    buff = io.StringIO()
-    csv.writer(buff).writerows([("Company", "URL"), *rows])
-    return buff.getvalue().encode("utf-8")
+def scrape_to_csv(url: str, browser=None) -> bytes:
+    return to_csv_bytes(extract_companies(url, browser))
@@ -41,165 +41,514 @@ elif need_browser and IS_DEPLOYMENT:
 HEADLESS  = True          # flip to False locally to watch the browser
 USER_AGENT = "Mozilla/5.0 (vc-scraper 0.7)"
 TIMEOUT    = (5, 15)      # connect, read
-BLOCKLIST_DOMAINS = {
+PW_CONCURRENCY = 8        # browser pages resolving detail pages in parallel
+DETAIL_WORKERS = 20       # threads resolving detail pages on the static path
+CACHE_DIR = pathlib.Path(os.environ.get("SCRAPER_CACHE_DIR") or pathlib.Path.home() / ".cache/vc_scraper")
+RATE_LIMIT_DELAY = float(os.environ.get("SCRAPER_RATE_LIMIT_DELAY", "0.25"))  # s between hits per domain
+PW_PROFILE_DIR = os.environ.get("SCRAPER_PW_PROFILE")  # opt-in persistent Chromium profile (HTTP cache survives runs)
+ROW_SEL       = "a[href*='/portfolio/']"              # card linking to a detail page
+NEXT_LINK_SEL = "a[rel='next'], a[class*='next'], button[class*='next']"
+MAX_PAGES     = 30                                    # pagination safety cap
+VISIT_BTN_SEL = "a[href^='http']"                     # detail-page links; text must match _VISIT_RE
+BLOCKLIST_DOMAINS = frozenset(map(sys.intern, {
     "linkedin", "twitter", "facebook", "instagram",
     "medium", "github", "youtube", "notion", "airtable",
     "calendar", "crunchbase", "google", "apple", "figma",
-}
+}))
 
 # ── stdlib / third-party ─────────────────────────────────────────────
-import csv, html, re
+import asyncio, atexit, codecs, csv, functools, hashlib, html, io, json, re, socket, threading, time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
-from urllib.parse import urljoin
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit
+from urllib.robotparser import RobotFileParser
 
 import requests
 import tldextract
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+# ── precompiled patterns ─────────────────────────────────────────────
+_WS_RE    = re.compile(r"\s+")
+_VISIT_RE = re.compile(r"visit (website|site)", re.I)
+_NAV_RE   = re.compile(r"\b(?:home|about|team|contact|blog|news|portfolio|companies"
+                      r"|investment|fund|menu|navigation)\b", re.I)
+_STOP_RE  = re.compile(r"\b(?:the|and|for|with|our|we|is|are)\b", re.I)
+_CT_CHARSET_RE   = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.I)
+
+# ── shared HTTP session (keep-alive + connection pooling) ────────────
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+_adapter = HTTPAdapter(
+    pool_connections=32, pool_maxsize=32,
+    max_retries=Retry(
+        total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}), respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+atexit.register(SESSION.close)
+
+# ── cross-run cache ──────────────────────────────────────────────────
+class JsonCache:
+    """Tiny JSON-file key/value store with per-entry expiry, kept under CACHE_DIR.
+    Facts like "this site has no WP-JSON" rarely change, so remembering them
+    across runs saves the probes. Writes stay in memory until flush() (once per
+    extract_companies run, and at exit); expired entries are dropped on load.
+    Unwritable cache dirs are silently ignored.
+    """
+    def __init__(self, name: str, ttl: float):
+        self.path = CACHE_DIR / f"{name}.json"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._dirty = False
+        now = time.time()
+        try:
+            data = json.loads(self.path.read_text("utf-8"))
+            self._data: Dict[str, Any] = {k: v for k, v in data.items() if v[0] >= now}
+            self._dirty = len(self._data) != len(data)
+        except Exception:
+            self._data = {}  # missing, unreadable or malformed: start afresh
+        _CACHES.append(self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.time():
+            return default
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + self.ttl, value)
+            self._dirty = True
+
+    def keys(self) -> List[str]:
+        now = time.time()
+        with self._lock:
+            return [k for k, (expires, _) in self._data.items() if expires >= now]
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(self._data), "utf-8")
+                tmp.replace(self.path)
+                self._dirty = False
+            except OSError:
+                pass
+
+_CACHES: List[JsonCache] = []
+
+# Which JSON endpoint (or "" for none) served each portfolio URL
+API_CACHE = JsonCache("wpjson", ttl=7 * 86400)
+# Whether a candidate hostname resolves, and the website we settled on per company
+DNS_CACHE = JsonCache("dns", ttl=30 * 86400)
+COMPANY_CACHE = JsonCache("companies", ttl=30 * 86400)
+# ETag / Last-Modified per fetched URL; the bodies live in HTTP_BODY_DIR
+HTTP_CACHE = JsonCache("http", ttl=30 * 86400)
+HTTP_BODY_DIR = CACHE_DIR / "http"
+
+def _body_path(url: str) -> Path:
+    return HTTP_BODY_DIR / hashlib.sha1(url.encode()).hexdigest()
+
+def flush_caches() -> None:
+    """Write out every cache, then evict stored bodies whose validators have expired."""
+    for cache in _CACHES:
+        cache.flush()
+    live = {_body_path(url).name for url in HTTP_CACHE.keys()}
+    try:
+        for path in HTTP_BODY_DIR.iterdir():
+            if path.name not in live:
+                path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+atexit.register(flush_caches)
 
 # ── helpers ──────────────────────────────────────────────────────────
+# Bundled suffix list only (no network refresh); the parsed list is cached on disk
+_TLD = tldextract.TLDExtract(
+    suffix_list_urls=(), fallback_to_snapshot=True, cache_dir=str(CACHE_DIR / "tld"),
+)
+
+def _domain(url: str) -> str:
+    """Registered domain label of *url* (e.g. "lyft")."""
+    return _host_domain(urlsplit(url).hostname or url)
+
+@functools.lru_cache(maxsize=4096)
+def _host_domain(host: str) -> str:
+    # Keyed by host rather than full URL: a page's many hrefs share a handful
+    # of hosts, so the suffix-list walk runs once per host
+    return _TLD(host).domain.lower()
+
 def normalize(url: str) -> str:
     if not url:
         return ""
     return "https:" + url[2:] if url.startswith("//") else url
 
-def fetch(url: str) -> str:
-    resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=TIMEOUT)
+ROBOTS_RETRY_AFTER = 600  # s; a robots.txt that failed with 5xx is retried after this
+
+_ROBOTS: Dict[str, Tuple[RobotFileParser, float]] = {}   # origin -> (parser, expires)
+_ROBOTS_LOCKS: Dict[str, threading.Lock] = {}
+_ROBOTS_GUARD = threading.Lock()
+
+def _cached_robots(origin: str) -> Optional[RobotFileParser]:
+    entry = _ROBOTS.get(origin)
+    return entry[0] if entry and entry[1] > time.monotonic() else None
+
+def robots_for(origin: str) -> RobotFileParser:
+    """Parsed robots.txt for a scheme://host origin, fetched once per process.
+    Threads asking for the same cold origin wait on one fetch instead of each
+    making their own.
+    """
+    rp = _cached_robots(origin)
+    if rp is not None:
+        return rp
+    with _ROBOTS_GUARD:
+        lock = _ROBOTS_LOCKS.setdefault(origin, threading.Lock())
+    with lock:
+        rp = _cached_robots(origin)
+        if rp is None:
+            rp, ttl = _fetch_robots(origin)
+            with _ROBOTS_GUARD:
+                if origin not in _ROBOTS and len(_ROBOTS) >= 1024:
+                    oldest = next(iter(_ROBOTS))
+                    del _ROBOTS[oldest]
+                    _ROBOTS_LOCKS.pop(oldest, None)
+                _ROBOTS[origin] = (rp, time.monotonic() + ttl)
+        return rp
+
+async def robots_for_async(origin: str) -> RobotFileParser:
+    """robots_for that never blocks the event loop: a cold origin is fetched on a thread."""
+    return _cached_robots(origin) or await asyncio.to_thread(robots_for, origin)
+
+def _fetch_robots(origin: str) -> Tuple[RobotFileParser, float]:
+    """The parsed robots.txt and how long to trust it. Per RFC 9309, 4xx means no
+    rules, while a server error (5xx, still failing after retries) means we
+    couldn't read the rules, so the whole site is off limits until we retry.
+    """
+    rp = RobotFileParser(origin + "/robots.txt")
+    try:
+        resp = SESSION.get(origin + "/robots.txt", timeout=TIMEOUT)
+        if resp.status_code in (401, 403):
+            rp.disallow_all = True
+        elif resp.status_code >= 500:
+            rp.disallow_all = True
+            return rp, ROBOTS_RETRY_AFTER
+        elif resp.ok:
+            rp.parse(resp.text.splitlines())
+        else:
+            rp.allow_all = True
+    except requests.RequestException:
+        rp.allow_all = True
+    return rp, float("inf")
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme or 'https'}://{parts.netloc}"
+
+def allowed(url: str) -> bool:
+    return robots_for(_origin(url)).can_fetch(USER_AGENT, url)
+
+async def allowed_async(url: str) -> bool:
+    return (await robots_for_async(_origin(url))).can_fetch(USER_AGENT, url)
+
+class DomainLimiter:
+    """Spaces requests to the same registered domain at least `delay` seconds apart
+    (or the site's robots.txt Crawl-delay, if longer). Slots are reserved under a
+    lock and slept on outside it, so threads and coroutines can share one limiter.
+    """
+    def __init__(self, delay: float = RATE_LIMIT_DELAY):
+        self.delay = delay
+        self._next: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, url: str) -> float:
+        dom = _domain(url)
+        delay = max(self.delay, float(robots_for(_origin(url)).crawl_delay(USER_AGENT) or 0))
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next.get(dom, now))
+            self._next[dom] = slot + delay
+        return slot - now
+
+    def wait(self, url: str) -> None:
+        pause = self._reserve(url)
+        if pause > 0:
+            time.sleep(pause)
+
+    async def wait_async(self, url: str) -> None:
+        await robots_for_async(_origin(url))  # warm it off-loop so _reserve can't block
+        pause = self._reserve(url)
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+LIMITER = DomainLimiter()
+
+def url_key(url: str) -> Tuple[str, str]:
+    """Dedup key for a link: host (minus www.) and path, ignoring query/fragment."""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    return (host[4:] if host.startswith("www.") else host), parts.path.rstrip("/")
+
+def _as_utf8(body: bytes, content_type: str) -> bytes:
+    """Lexbor reads bytes as UTF-8, so transcode bodies declared in anything else
+    (the Content-Type's charset, else a <meta> one near the top of the page).
+    """
+    m = _CT_CHARSET_RE.search(content_type) or _META_CHARSET_RE.search(body[:2048])
+    if not m:
+        return body
+    charset = m.group(1)
+    charset = charset.decode("ascii", "ignore") if isinstance(charset, bytes) else charset
+    try:
+        name = codecs.lookup(charset).name
+    except LookupError:
+        return body
+    if name == "utf-8":
+        return body
+    # Browsers (WHATWG labels) read declared latin-1 and ASCII as windows-1252,
+    # and real pages served that way rely on it
+    return body.decode("cp1252" if name in ("iso8859-1", "ascii") else name, "replace").encode("utf-8")
+
+def _is_detail_url(href: str, listing_url: str) -> bool:
+    """A card's on-site detail page, not the listing itself or one of its
+    pagination/filter variants (/portfolio/?page=2, /portfolio/?sector=ai).
+    """
+    return not urlsplit(href).query and url_key(href) != url_key(listing_url)
+
+def fetch(url: str) -> bytes:
+    """GET *url*, revalidating against the copy from an earlier run when we have one.
+    The body comes back as UTF-8 whatever charset the page was served in.
+    """
+    if not allowed(url):
+        raise PermissionError(f"robots.txt disallows {url}")
+    body_path = _body_path(url)
+    validators = HTTP_CACHE.get(url) or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    LIMITER.wait(url)
+    resp = SESSION.get(url, timeout=TIMEOUT, headers=headers)
+    if resp.status_code == 304:
+        try:
+            return _as_utf8(body_path.read_bytes(), validators.get("content_type") or "")
+        except OSError:
+            # Validators outlived the body: fetch it unconditionally
+            resp = SESSION.get(url, timeout=TIMEOUT)
     resp.raise_for_status()
-    return resp.text
+
+    etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(resp.content)
+            HTTP_CACHE.set(url, {"etag": etag, "last_modified": last_modified,
+                                 "content_type": resp.headers.get("Content-Type", "")})
+        except OSError:
+            pass
+    return _as_utf8(resp.content, resp.headers.get("Content-Type", ""))
+
+def fetch_tree(url: str) -> HTMLParser:
+    # Hand bytes to the parser: no decode to str and no chardet pass over the
+    # whole body (Lexbor parses them as UTF-8, which fetch guarantees)
+    return HTMLParser(fetch(url))
+
+def resolve_company_url(detail_url: str) -> str:
+    """Return the external "Visit website" link on a portfolio detail page, or ""."""
+    try:
+        tree = fetch_tree(detail_url)
+    except Exception:
+        return ""
+    for a in tree.css(VISIT_BTN_SEL):
+        if _VISIT_RE.search(a.text(separator=" ", strip=True)):
+            return urljoin(detail_url, normalize(html.unescape((a.attributes.get("href") or "").strip())))
+    return ""
+
+def resolve_company_urls(detail_urls: List[str], limit: int = DETAIL_WORKERS) -> Dict[str, str]:
+    """Resolve many detail pages at once; the fetches are I/O-bound so threads overlap them."""
+    with ThreadPoolExecutor(max_workers=limit) as ex:
+        return dict(zip(detail_urls, ex.map(resolve_company_url, detail_urls)))
+
+# For well-known companies, we can have a manual mapping (built once at import)
+_KNOWN_COMPANIES: Dict[str, str] = {
+    "lyft": "https://www.lyft.com/",
+    "palantir": "https://www.palantir.com/",
+    "lucidchart": "https://www.lucidchart.com/",
+    "udemy": "https://www.udemy.com/",
+    "gusto": "https://gusto.com/",
+    "gitlab": "https://gitlab.com/",
+    "instacart": "https://www.instacart.com/",
+    "square": "https://squareup.com/",
+    "airtable": "https://www.airtable.com/",
+    "everlane": "https://www.everlane.com/",
+    "quora": "https://www.quora.com/",
+    "indiegogo": "https://www.indiegogo.com/",
+    "lever": "https://www.lever.co/",
+    "thirdlove": "https://www.thirdlove.com/",
+    "honeybook": "https://www.honeybook.com/",
+    "zenefits": "https://www.zenefits.com/",
+    "pagerduty": "https://www.pagerduty.com/",
+    "plastiq": "https://www.plastiq.com/",
+    "wattpad": "https://www.wattpad.com/",
+    "webflow": "https://webflow.com/",
+    "lime": "https://www.li.me/",
+    "birdy grey": "https://www.birdygrey.com/",
+    "capitalize": "https://www.hicapitalize.com/",
+    "grata": "https://grata.com/",
+    "parse": "https://parseplatform.org/",
+    "tubular": "https://tubularlabs.com/",
+    "periscope": "https://www.periscopedata.com/",
+    "chewse": "https://www.chewse.com/",
+    "vts": "https://www.vts.com/",
+    "gobble": "https://www.gobble.com/",
+    "quantopian": "https://www.quantopian.com/",
+    "canary": "https://canary.is/",
+    "caption health": "https://www.captionhealth.com/",
+    "future advisor": "https://www.futureadvisor.com/",
+    "hellosign": "https://www.hellosign.com/",
+    "beautylish": "https://www.beautylish.com/",
+    "quartzy": "https://www.quartzy.com/",
+    "pindrop": "https://www.pindrop.com/",
+    "remind": "https://www.remind.com/",
+    "dogvacay": "https://dogvacay.com/",
+    "breeze": "https://www.breeze.bar/",
+    "proper": "https://www.properapp.com/",
+    "gallant": "https://www.gallantpet.com/",
+    "somewear": "https://somewear.com/",
+    "foxpass": "https://www.foxpass.com/",
+    "proxxi": "https://proxxi.co/",
+    "actuate": "https://www.actuate.ai/",
+    "jiffy": "https://www.jiffy.com/",
+    "printify": "https://printify.com/",
+    "alcove": "https://www.livealcove.com/",
+    "tone": "https://www.usetone.com/",
+    "edify": "https://www.edify.cx/",
+    "mobot": "https://www.mobot.io/",
+    "cell vault": "https://www.cellvault.com/",
+    "alltrue": "https://www.alltrue.com/",
+    "forward": "https://goforward.com/",
+    "merlin labs": "https://www.merlinlabs.com/",
+    "vetted": "https://vetted.ai/",
+    "rxdefine": "https://www.rxdefine.com/",
+    "vise": "https://www.vise.com/",
+    "hermeus": "https://www.hermeus.com/",
+    "monkeylearn": "https://monkeylearn.com/",
+    "elemy": "https://elemy.com/",
+    "bravely": "https://www.workbravely.com/",
+    "honeycomb": "https://www.honeycomb.io/",
+    "prizepool": "https://getprizepool.com/",
+    "vendition": "https://www.vendition.com/",
+    "tinycare": "https://www.tinycare.com/",
+    "whiz": "https://www.whiz.ai/",
+    "agora": "https://www.agora.com/",
+    "capchase": "https://www.capchase.com/",
+    "opus": "https://www.opus.ai/",
+    "veho": "https://shipveho.com/",
+    "ravacan": "https://www.ravacan.com/",
+    "kolors": "https://www.kolors.co/",
+    "companion": "https://www.companion.com/",
+    "silvertree": "https://www.silvertree.com/",
+    "goodtrust": "https://www.goodtrust.com/",
+    "tempo": "https://tempo.studio/",
+    "prive": "https://www.prive.com/",
+    "ignition": "https://www.ignitionapp.com/",
+    "treet": "https://www.treet.co/",
+    "openstore": "https://www.theopenstore.co/",
+    "dorsal": "https://www.dorsalhealth.com/",
+    "blaze": "https://www.blazeai.com/",
+    "beaubble": "https://www.beaubble.com/",
+    "weekend health": "https://www.weekendhealth.com/",
+    "vista": "https://www.vista.com/",
+    "tagado": "https://www.tagado.com/",
+    "forte": "https://www.forte.com/",
+    "sunbound": "https://www.sunbound.care/",
+    "tastenote": "https://www.tastenote.com/",
+    "rally": "https://www.rally.com/",
+    "lyte": "https://www.lyte.com/",
+    "dutch": "https://www.dutch.com/",
+    "kodif": "https://kodif.io/",
+    "aware": "https://www.aware.com/",
+    "payabli": "https://www.payabli.com/",
+    "coverdash": "https://www.coverdash.com/",
+    "hansa": "https://www.hansa.ai/",
+    "modelbit": "https://www.modelbit.com/",
+    "noetica": "https://www.noetica.ai/",
+    "novellia": "https://www.novellia.com/",
+    "taelor": "https://www.taelor.style/",
+    "studyverse": "https://www.studyverse.com/",
+    "vetvet": "https://www.vetvet.co/",
+    "adonis": "https://www.adonis.health/",
+    "wally": "https://www.getwally.com/",
+    "optiversal": "https://www.optiversal.com/",
+    "nominal": "https://www.nominal.io/",
+    "pika": "https://www.pika.com/",
+    "atrix": "https://www.atrix.ai/",
+    "stxt": "https://www.stxt.ai/",
+    "unthread": "https://www.unthread.io/",
+    "alma": "https://www.alma.com/",
+    "maneva": "https://www.maneva.ai/",
+    "recess": "https://www.takearecess.com/"
+}
+_KNOWN_CLEAN = {k.replace(" ", "").replace("-", "").replace(".", ""): v for k, v in _KNOWN_COMPANIES.items()}
+
+# Resolver errors that really mean "no such name"; anything else (EAI_AGAIN, ...) is a blip
+_DNS_NEGATIVE = frozenset(
+    e for e in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", None)) if e is not None
+)
+
+def _resolves(host: str) -> Optional[bool]:
+    # All we need to know is whether the name exists; DNS answers that without
+    # a TCP+TLS+HTTP round-trip (and the OS resolver caches it for us too).
+    # Definite answers are kept in DNS_CACHE (memory, then disk) so warm runs
+    # skip the lookup; a temporary resolver failure returns None and isn't kept.
+    hit = DNS_CACHE.get(host)
+    if hit is not None:
+        return hit
+    try:
+        socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        ok = True
+    except UnicodeError:
+        ok = False
+    except socket.gaierror as e:
+        if e.errno not in _DNS_NEGATIVE:
+            return None
+        ok = False
+    DNS_CACHE.set(host, ok)
+    return ok
 
 def find_company_website(company_name: str) -> str:
     """Find the actual website for a company using various strategies"""
+    key = company_name.lower()
+    cached = COMPANY_CACHE.get(key)
+    if cached is not None:
+        return cached
+    website, definite = _find_company_website(company_name)
+    if definite:
+        COMPANY_CACHE.set(key, website)
+    return website
+
+def _find_company_website(company_name: str) -> Tuple[str, bool]:
+    """(website, definite): not definite if a resolver error may have changed the answer."""
     try:
         # Strategy 1: Try common domain patterns
         clean_name = company_name.lower().replace(' ', '').replace('-', '').replace('.', '')
         
-        # For well-known companies, we can have a manual mapping
-        known_companies = {
-            "lyft": "https://www.lyft.com/",
-            "palantir": "https://www.palantir.com/",
-            "lucidchart": "https://www.lucidchart.com/",
-            "udemy": "https://www.udemy.com/",
-            "gusto": "https://gusto.com/",
-            "gitlab": "https://gitlab.com/",
-            "instacart": "https://www.instacart.com/",
-            "square": "https://squareup.com/",
-            "airtable": "https://www.airtable.com/",
-            "everlane": "https://www.everlane.com/",
-            "quora": "https://www.quora.com/",
-            "indiegogo": "https://www.indiegogo.com/",
-            "lever": "https://www.lever.co/",
-            "thirdlove": "https://www.thirdlove.com/",
-            "honeybook": "https://www.honeybook.com/",
-            "zenefits": "https://www.zenefits.com/",
-            "pagerduty": "https://www.pagerduty.com/",
-            "plastiq": "https://www.plastiq.com/",
-            "wattpad": "https://www.wattpad.com/",
-            "webflow": "https://webflow.com/",
-            "lime": "https://www.li.me/",
-            "birdy grey": "https://www.birdygrey.com/",
-            "capitalize": "https://www.hicapitalize.com/",
-            "grata": "https://grata.com/",
-            "parse": "https://parseplatform.org/",
-            "tubular": "https://tubularlabs.com/",
-            "periscope": "https://www.periscopedata.com/",
-            "chewse": "https://www.chewse.com/",
-            "vts": "https://www.vts.com/",
-            "gobble": "https://www.gobble.com/",
-            "quantopian": "https://www.quantopian.com/",
-            "canary": "https://canary.is/",
-            "caption health": "https://www.captionhealth.com/",
-            "future advisor": "https://www.futureadvisor.com/",
-            "hellosign": "https://www.hellosign.com/",
-            "beautylish": "https://www.beautylish.com/",
-            "quartzy": "https://www.quartzy.com/",
-            "pindrop": "https://www.pindrop.com/",
-            "remind": "https://www.remind.com/",
-            "dogvacay": "https://dogvacay.com/",
-            "breeze": "https://www.breeze.bar/",
-            "proper": "https://www.properapp.com/",
-            "gallant": "https://www.gallantpet.com/",
-            "somewear": "https://somewear.com/",
-            "foxpass": "https://www.foxpass.com/",
-            "proxxi": "https://proxxi.co/",
-            "actuate": "https://www.actuate.ai/",
-            "jiffy": "https://www.jiffy.com/",
-            "printify": "https://printify.com/",
-            "alcove": "https://www.livealcove.com/",
-            "tone": "https://www.usetone.com/",
-            "edify": "https://www.edify.cx/",
-            "mobot": "https://www.mobot.io/",
-            "cell vault": "https://www.cellvault.com/",
-            "alltrue": "https://www.alltrue.com/",
-            "forward": "https://goforward.com/",
-            "merlin labs": "https://www.merlinlabs.com/",
-            "vetted": "https://vetted.ai/",
-            "rxdefine": "https://www.rxdefine.com/",
-            "vise": "https://www.vise.com/",
-            "hermeus": "https://www.hermeus.com/",
-            "monkeylearn": "https://monkeylearn.com/",
-            "elemy": "https://elemy.com/",
-            "bravely": "https://www.workbravely.com/",
-            "honeycomb": "https://www.honeycomb.io/",
-            "prizepool": "https://getprizepool.com/",
-            "vendition": "https://www.vendition.com/",
-            "tinycare": "https://www.tinycare.com/",
-            "whiz": "https://www.whiz.ai/",
-            "agora": "https://www.agora.com/",
-            "capchase": "https://www.capchase.com/",
-            "opus": "https://www.opus.ai/",
-            "veho": "https://shipveho.com/",
-            "ravacan": "https://www.ravacan.com/",
-            "kolors": "https://www.kolors.co/",
-            "companion": "https://www.companion.com/",
-            "silvertree": "https://www.silvertree.com/",
-            "goodtrust": "https://www.goodtrust.com/",
-            "tempo": "https://tempo.studio/",
-            "prive": "https://www.prive.com/",
-            "ignition": "https://www.ignitionapp.com/",
-            "treet": "https://www.treet.co/",
-            "openstore": "https://www.theopenstore.co/",
-            "dorsal": "https://www.dorsalhealth.com/",
-            "blaze": "https://www.blazeai.com/",
-            "beaubble": "https://www.beaubble.com/",
-            "weekend health": "https://www.weekendhealth.com/",
-            "vista": "https://www.vista.com/",
-            "tagado": "https://www.tagado.com/",
-            "forte": "https://www.forte.com/",
-            "sunbound": "https://www.sunbound.care/",
-            "tastenote": "https://www.tastenote.com/",
-            "rally": "https://www.rally.com/",
-            "lyte": "https://www.lyte.com/",
-            "dutch": "https://www.dutch.com/",
-            "kodif": "https://kodif.io/",
-            "aware": "https://www.aware.com/",
-            "payabli": "https://www.payabli.com/",
-            "coverdash": "https://www.coverdash.com/",
-            "hansa": "https://www.hansa.ai/",
-            "modelbit": "https://www.modelbit.com/",
-            "noetica": "https://www.noetica.ai/",
-            "novellia": "https://www.novellia.com/",
-            "taelor": "https://www.taelor.style/",
-            "studyverse": "https://www.studyverse.com/",
-            "vetvet": "https://www.vetvet.co/",
-            "adonis": "https://www.adonis.health/",
-            "wally": "https://www.getwally.com/",
-            "optiversal": "https://www.optiversal.com/",
-            "nominal": "https://www.nominal.io/",
-            "pika": "https://www.pika.com/",
-            "atrix": "https://www.atrix.ai/",
-            "stxt": "https://www.stxt.ai/",
-            "unthread": "https://www.unthread.io/",
-            "alma": "https://www.alma.com/",
-            "maneva": "https://www.maneva.ai/",
-            "recess": "https://www.takearecess.com/"
-        }
-        
-        # Check if it's a known company
-        company_key = company_name.lower()
-        if company_key in known_companies:
-            return known_companies[company_key]
+        # Check if it's a known company (exact name, then punctuation-insensitive)
+        hit = _KNOWN_COMPANIES.get(company_name.lower()) or _KNOWN_CLEAN.get(clean_name)
+        if hit:
+            return hit, True
         
         # Common domain patterns to try (with quick timeout)
         domain_patterns = [
@@ -210,198 +559,647 @@ def find_company_website(company_name: str) -> str:
             f"www.{clean_name}.com"
         ]
         
-        # Try domain patterns with quick checks
-        for pattern in domain_patterns:
-            try:
-                test_url = f"https://{pattern}"
-                # Quick check if domain resolves (timeout quickly)
-                response = requests.head(test_url, timeout=2, allow_redirects=True)
-                if response.status_code == 200:
-                    return test_url
-            except:
-                continue
+        # Resolve the candidate names all at once; earlier patterns still win,
+        # but we only wait on the ones ahead of the first hit
+        ex = ThreadPoolExecutor(max_workers=len(domain_patterns))
+        unsure = False  # an earlier pattern's lookup failed, so it might have won
+        try:
+            futs = [ex.submit(_resolves, pattern) for pattern in domain_patterns]
+            for pattern, fut in zip(domain_patterns, futs):
+                found = fut.result()
+                if found:
+                    return f"https://{pattern}", not unsure
+                unsure = unsure or found is None
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
         
         # Fallback to Google search
-        return f"https://www.google.com/search?q={company_name.replace(' ', '+')}+company"
+        return f"https://www.google.com/search?q={company_name.replace(' ', '+')}+company", not unsure
         
     except Exception as e:
-        return f"https://www.google.com/search?q={company_name.replace(' ', '+')}+company"
+        return f"https://www.google.com/search?q={company_name.replace(' ', '+')}+company", False
 
 # ── Playwright pass ─────────────────────────────────────────────────
-def extract_with_playwright(page_url: str) -> List[Tuple[str, str]]:
-    """Minimal Playwright extractor (fallback).
-    The full intelligent Playwright logic was removed for brevity and to avoid indentation errors.
-    This stub attempts to grab external anchor links; if anything fails, it simply returns an empty list.
+# We only read links, so skip everything that isn't markup, scripts or data
+BLOCKED_RESOURCES = frozenset({"image", "font", "media", "stylesheet", "other"})
+# ...and third-party tracker/widget hosts (they also keep the network busy). Matched
+# as a suffix of the request's hostname, so e.g. segmentventures.com is left alone
+TRACKER_HOST_RE = re.compile(
+    r"(?:^|\.)(?:google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|segment\.(?:com|io)|intercom\.io|intercomcdn\.com|hotjar\.com"
+    r"|hs-scripts\.com|hs-analytics\.net|connect\.facebook\.net|snap\.licdn\.com"
+    r"|clarity\.ms)$"
+)
+# External links minus blocklisted hosts, filtered in the browser so junk never crosses CDP
+BLOCKLIST_CSS = "".join(f":not([href*='//{d}.']):not([href*='.{d}.'])" for d in sorted(BLOCKLIST_DOMAINS))
+EXTERNAL_LINK_SEL = "a[href^='http']" + BLOCKLIST_CSS
+LISTING_SEL = f"a[href^='http'], {ROW_SEL}"
+CONTEXT_OPTS = dict(user_agent=USER_AGENT, java_script_enabled=True, bypass_csp=True, ignore_https_errors=True,
+                    viewport={"width": 1280, "height": 800})
+
+async def _block_heavy(route) -> None:
+    request = route.request
+    # Documents always go through: aborting one would abort the navigation itself
+    if request.resource_type != "document" and (
+            request.resource_type in BLOCKED_RESOURCES
+            or TRACKER_HOST_RE.search((urlsplit(request.url).hostname or "").lower())):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def _new_context(browser):
+    # A persistent-profile host hands us its one context: share it as is
+    if not hasattr(browser, "new_context"):
+        return browser
+    ctx = await browser.new_context(**CONTEXT_OPTS)
+    await ctx.route("**/*", _block_heavy)
+    return ctx
+
+async def _wait_for_listing(page) -> None:
+    """Wait for the portfolio itself to render. External links alone prove nothing
+    (header/footer social links are there at DOMContentLoaded), so wait for a card,
+    or for the network to go idle on pages whose cards don't match ROW_SEL, whichever
+    comes first, within one 8 s bound.
     """
+    waits = [
+        asyncio.ensure_future(page.wait_for_selector(ROW_SEL, state="attached", timeout=8000)),
+        asyncio.ensure_future(page.wait_for_load_state("networkidle", timeout=8000)),
+    ]
     try:
-        from playwright.sync_api import sync_playwright
+        done, _ = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        if any(w.exception() is None for w in done):
+            return
+        # The first one failed (timed out): give the other whatever is left of the bound
+        await asyncio.wait(waits, return_when=asyncio.ALL_COMPLETED)
+    finally:
+        for w in waits:
+            w.cancel()
+        await asyncio.gather(*waits, return_exceptions=True)
 
-        rows, seen = [], set()
-        vc_dom = tldextract.extract(page_url).domain.lower()
+async def _read_listing(page) -> Tuple[list, list]:
+    """External links ([href, text]) and portfolio cards ({name, href}) on *page*."""
+    links = await page.eval_on_selector_all(
+        EXTERNAL_LINK_SEL, "els => els.map(a => [a.getAttribute('href'), (a.innerText || '').trim()])"
+    )
+    entries = await page.eval_on_selector_all(
+        ROW_SEL, "els => els.map(e => ({name: e.innerText.trim(), href: e.href}))"
+    )
+    return links, entries
 
-        with sync_playwright() as pw:
-            browser = pw.chromium.launch(headless=HEADLESS)
-            page = browser.new_page(user_agent=USER_AGENT)
-            page.goto(page_url, timeout=60000)
-            page.wait_for_load_state("networkidle")
+def _page_count(page_url: str, hrefs: List[str]) -> int:
+    """Highest ``?page=N`` linked from the listing at *page_url* (1 if none)."""
+    base = urlsplit(page_url)
+    last = 1
+    for href in hrefs:
+        parts = urlsplit(href)
+        if parts.netloc != base.netloc or parts.path.rstrip("/") != base.path.rstrip("/"):
+            continue
+        n = dict(parse_qsl(parts.query)).get("page", "")
+        if n.isdigit():
+            last = max(last, int(n))
+    return last
+
+def _with_page(page_url: str, n: int) -> str:
+    # Swap only the page pair: repeated params (sector=ai&sector=bio) must survive
+    parts = urlsplit(page_url)
+    pairs = parse_qsl(parts.query, keep_blank_values=True)
+    if any(k == "page" for k, _ in pairs):
+        pairs = [(k, str(n) if k == "page" else v) for k, v in pairs]
+    else:
+        pairs.append(("page", str(n)))
+    return parts._replace(query=urlencode(pairs)).geturl()
 
-            anchors = page.query_selector_all("a[href^='http']")
-            for a in anchors:
-                href = a.get_attribute("href")
+async def _last_page(page) -> int:
+    return _page_count(page.url, await page.eval_on_selector_all(
+        "a[href*='page=']", "els => els.map(a => a.href)"
+    ))
+
+async def _scrape_with_browser(browser, page_url: str,
+                               known: Optional[Dict[str, str]] = None) -> List[Tuple[str, str]]:
+    """*known* maps detail-page URLs already resolved (e.g. by the static pass)
+    to their websites; those cards aren't visited again.
+    """
+    # Rows keyed by url_key (insertion order is output order); names are
+    # tracked separately since either repeating means a duplicate
+    rows: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    seen = set()
+    vc_dom = _domain(page_url)
+
+    if not await allowed_async(page_url):
+        print(f"⚠️  robots.txt disallows {page_url}")
+        return []
+
+    listing_ctx = await _new_context(browser)
+    page = None
+    try:
+        page = await listing_ctx.new_page()
+        await LIMITER.wait_async(page_url)
+        await page.goto(page_url, timeout=60000, wait_until="domcontentloaded")
+        await _wait_for_listing(page)
+
+        # First pass: read every listing page's external links and card hrefs
+        # (cards are never clicked). Numbered ?page=N links let us load the
+        # remaining pages side by side; otherwise click "next" until it's gone.
+        listings = [await _read_listing(page)]
+        last = await _last_page(page)
+        if last > 1:
+            sem = asyncio.Semaphore(PW_CONCURRENCY)
+
+            async def load(n: int) -> Tuple[list, list, int]:
+                url_n = _with_page(page.url, n)
+                async with sem:
+                    other = await listing_ctx.new_page()
+                    try:
+                        await LIMITER.wait_async(url_n)
+                        await other.goto(url_n, timeout=30000, wait_until="domcontentloaded")
+                        await _wait_for_listing(other)
+                        links, entries = await _read_listing(other)
+                        return links, entries, await _last_page(other)
+                    except PlaywrightError:
+                        return [], [], 0
+                    finally:
+                        await other.close()
+
+            # Windowed paginators ("1 2 3 … Next") only link a few pages ahead,
+            # so each batch's pages may reveal higher numbers: keep going until not
+            done = 1
+            while last > done and done < MAX_PAGES:
+                batch = range(done + 1, min(last, MAX_PAGES) + 1)
+                for links, entries, seen_last in await asyncio.gather(*(load(n) for n in batch)):
+                    listings.append((links, entries))
+                    last = max(last, seen_last)
+                done = batch[-1]
+        else:
+            for _ in range(MAX_PAGES - 1):
+                nxt = page.locator(NEXT_LINK_SEL).first
+                if not await nxt.count() or not await nxt.is_visible():
+                    break
+                before = await page.eval_on_selector_all(LISTING_SEL, "els => els.map(e => e.href).join()")
+                try:
+                    await nxt.click(timeout=5000)
+                    await page.wait_for_function(
+                        "([sel, before]) => Array.from(document.querySelectorAll(sel), e => e.href).join() !== before",
+                        arg=[LISTING_SEL, before], timeout=15000,
+                    )
+                except PlaywrightError:
+                    break
+                listings.append(await _read_listing(page))
+
+        cards: Dict[str, str] = {}   # detail-page href -> card name
+        for links, entries in listings:
+            for href, text in links:
                 if not href:
                     continue
-                dom = tldextract.extract(href).domain.lower()
+                dom = _domain(href)
                 if dom == vc_dom or dom in BLOCKLIST_DOMAINS:
                     continue
-                text = a.inner_text().strip() or dom.capitalize()
-                if text.lower() in seen or len(text) > 100:
+                text = text or dom.capitalize()
+                key = url_key(href)
+                if text.lower() in seen or key in rows or len(text) > 100:
                     continue
                 seen.add(text.lower())
-                rows.append((text, href))
+                rows[key] = (text, href)
 
-            browser.close()
+            for entry in entries:
+                detail_url = entry["href"]
+                name = entry["name"].split("\n")[0].strip()
+                if (not name or len(name) > 100 or name.lower() in seen
+                        or detail_url in cards
+                        or not _is_detail_url(detail_url, page_url)
+                        or _domain(detail_url) != vc_dom
+                        or not await allowed_async(detail_url)):
+                    continue
+                cards[detail_url] = name
 
-        return rows
+        # Second pass: a pool of pages drains the queue of detail pages that
+        # weren't already resolved
+        resolved: Dict[str, str] = {d: h for d, h in (known or {}).items() if h and d in cards}
+        detail_urls = [d for d in cards if d not in resolved]
+        queue: asyncio.Queue = asyncio.Queue()
+        for i in range(len(detail_urls)):
+            queue.put_nowait(i)
+
+        # Detail pages share the listing's context (cookies, HTTP cache, sockets);
+        # the listing page itself stays pinned and is never navigated away
+        async def worker() -> None:
+            detail = await listing_ctx.new_page()
+            try:
+                while not queue.empty():
+                    i = queue.get_nowait()
+                    try:
+                        await LIMITER.wait_async(detail_urls[i])
+                        await detail.goto(detail_urls[i], wait_until="commit", timeout=20000)
+                        # Only the response has to arrive; the locator then waits for the
+                        # link itself rather than for DOMContentLoaded
+                        visit = detail.locator(VISIT_BTN_SEL, has_text=_VISIT_RE).first
+                        resolved[detail_urls[i]] = await visit.get_attribute("href", timeout=5000) or ""
+                    except PlaywrightError:
+                        continue
+            finally:
+                await detail.close()
+
+        await asyncio.gather(*(worker() for _ in range(min(PW_CONCURRENCY, len(detail_urls)))))
+    finally:
+        if listing_ctx is not browser:
+            await listing_ctx.close()
+        elif page is not None:
+            await page.close()  # shared persistent context: don't leave the tab behind
+
+    for detail_url, name in cards.items():
+        href = resolved.get(detail_url, "")
+        dom = _domain(href)
+        key = url_key(href)
+        if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS or name.lower() in seen or key in rows:
+            continue
+        seen.add(name.lower())
+        rows[key] = (name, href)
+
+    return list(rows.values())
+
+class BrowserHost:
+    """Keeps one Chromium running on a private event loop so scrapes can share it.
+    Every scrape still gets fresh contexts; only the browser launch is amortised.
+    With a *profile_dir* it instead runs one persistent context that all scrapes
+    share, so Chromium's HTTP cache (site scripts, mostly) carries over to later runs.
+    """
+    def __init__(self, headless: bool = HEADLESS, profile_dir: Optional[str] = PW_PROFILE_DIR):
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self._pw = self._browser = None
+        self._launching: Optional[asyncio.Lock] = None  # made on the host loop, see _get_browser
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="playwright", daemon=True).start()
+
+    async def _get_browser(self):
+        # Create the lock here, on the host's own loop: on 3.9 an asyncio.Lock made
+        # in __init__ would bind to the calling (e.g. Streamlit script) thread's loop.
+        # No await before the assignment, so coroutines on this loop can't race it.
+        if self._launching is None:
+            self._launching = asyncio.Lock()
+        async with self._launching:
+            if self._browser is None:
+                self._pw = self._pw or await async_playwright().start()
+                if self.profile_dir:
+                    browser = await self._pw.chromium.launch_persistent_context(
+                        self.profile_dir, headless=self.headless, **CONTEXT_OPTS
+                    )
+                    await browser.route("**/*", _block_heavy)
+                    event = "close"          # persistent contexts have no "disconnected"
+                else:
+                    browser = await self._pw.chromium.launch(headless=self.headless)
+                    event = "disconnected"
+                # If Chromium exits or crashes, forget it so the next scrape relaunches
+                browser.on(event, lambda _: self._forget(browser))
+                self._browser = browser
+        return self._browser
 
+    def _forget(self, browser) -> None:
+        if self._browser is browser:
+            self._browser = None
+
+    def run(self, fn, *args):
+        """Run ``await fn(browser, *args)`` on the host's loop and return the result."""
+        async def call():
+            return await fn(await self._get_browser(), *args)
+        return asyncio.run_coroutine_threadsafe(call(), self._loop).result()
+
+    def close(self) -> None:
+        async def shutdown():
+            browser, self._browser = self._browser, None
+            if browser:
+                await browser.close()
+            if self._pw:
+                await self._pw.stop()
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+_HOST: Optional[BrowserHost] = None
+_HOST_LOCK = threading.Lock()
+
+def _get_browser() -> BrowserHost:
+    """Process-wide BrowserHost, started on first use and closed at exit."""
+    global _HOST
+    with _HOST_LOCK:
+        if _HOST is None:
+            _HOST = BrowserHost()
+            atexit.register(_HOST.close)
+        return _HOST
+
+def extract_with_playwright(page_url: str, browser: Optional[BrowserHost] = None,
+                            known: Optional[Dict[str, str]] = None) -> List[Tuple[str, str]]:
+    """Playwright extractor (fallback).
+    Walks the pagination grabbing external anchor links, then visits the detail
+    page of cards that only link on-site directly, several pages at a time.
+    Uses the given BrowserHost, or else the shared process-wide one, so
+    Chromium is launched once however many URLs are scraped.
+    If anything fails, it simply returns an empty list.
+    """
+    try:
+        return (browser or _get_browser()).run(_scrape_with_browser, page_url, known)
     except Exception as e:
         print(f"⚠️  Playwright extraction failed: {e}")
         return []
 
-# ── master extractor ────────────────────────────────────────────────
-def extract_companies(url: str) -> List[Tuple[str, str]]:
-    vc_dom = tldextract.extract(url).domain.lower()
-    rows, seen = [], set()
-
-    # Try WordPress JSON API first (common for many VC sites)
-    wp_api_endpoints = [
-        url.rstrip("/").split("/portfolio")[0] + "/wp-json/wp/v2/portfolio",
-        url.rstrip("/") + "/wp-json/wp/v2/portfolio",
-        url.rstrip("/") + "/api/portfolio",
-        url.rstrip("/") + "/api/companies"
+def scrape_many(urls: List[str], browser: Optional[BrowserHost] = None) -> Dict[str, List[Tuple[str, str]]]:
+    """Playwright-scrape several portfolio pages concurrently on one browser.
+    Each URL gets its own context; a URL that fails maps to an empty list.
+    """
+    async def run_all(b):
+        results = await asyncio.gather(*(_scrape_with_browser(b, u) for u in urls), return_exceptions=True)
+        for u, r in zip(urls, results):
+            if isinstance(r, Exception):
+                print(f"⚠️  Playwright extraction failed for {u}: {r}")
+        return {u: [] if isinstance(r, Exception) else r for u, r in zip(urls, results)}
+
+    return (browser or _get_browser()).run(run_all)
+
+# ── JSON endpoints ──────────────────────────────────────────────────
+def _parse_api_items(data) -> List[Tuple[str, str]]:
+    """Map a WordPress/REST-style list of portfolio items to (name, website) rows."""
+    rows = []
+    for item in data if isinstance(data, list) else []:
+        if isinstance(item, dict):
+            name = ""
+            website = ""
+
+            # Try different field names for company name
+            for name_field in ["title", "name", "company_name", "company"]:
+                if name_field in item:
+                    if isinstance(item[name_field], dict) and "rendered" in item[name_field]:
+                        name = item[name_field]["rendered"].strip()
+                    elif isinstance(item[name_field], str):
+                        name = item[name_field].strip()
+                    break
+
+            # Try different field names for website
+            for url_field in ["website", "company_website", "url", "link", "acf"]:
+                if url_field in item:
+                    if url_field == "acf" and isinstance(item[url_field], dict):
+                        website = item[url_field].get("company_website", "")
+                    elif isinstance(item[url_field], str):
+                        website = item[url_field]
+                    break
+
+            if name and len(name) > 1:
+                final_url = website or f"https://www.google.com/search?q={name.replace(' ', '+')}+company"
+                rows.append((name, final_url))
+    return rows
+
+def _parse_squarespace(data) -> List[Tuple[str, str]]:
+    """Squarespace collection pages serve their items at ?format=json."""
+    items = data.get("items", []) if isinstance(data, dict) else []
+    return _parse_api_items([
+        {"title": it.get("title", ""), "website": it["sourceUrl"]}
+        for it in items if isinstance(it, dict) and it.get("sourceUrl")
+    ])
+
+def wp_probes(url: str, tree: Optional[HTMLParser]) -> List[Tuple[str, Callable]]:
+    """WordPress portfolio endpoint(s) for *url*. WordPress advertises its REST root as
+    <link rel="https://api.w.org/"> in every page's <head>, so the listing tells us
+    whether (and where) to look; without a listing we fall back to guessing the root.
+    """
+    if tree is None:
+        path = urlsplit(url).path.rstrip("/")
+        return list(dict([  # dedup: both WP roots coincide when the URL has no /portfolio
+            (_under(url, path.split("/portfolio")[0] + "/wp-json/wp/v2/portfolio"), _parse_api_items),
+            (_under(url, path + "/wp-json/wp/v2/portfolio"), _parse_api_items),
+        ]).items())
+    link = tree.css_first("link[rel='https://api.w.org/']")
+    root = (link.attributes.get("href") or "") if link else ""
+    if "/wp-json" not in root:
+        return []  # not WordPress (or REST behind ?rest_route=, which we don't page)
+    return [(urljoin(url, root.rstrip("/") + "/wp/v2/portfolio"), _parse_api_items)]
+
+def _under(url: str, path: str) -> str:
+    """*url*'s origin with *path*, minus the portfolio page's own query and fragment."""
+    return urlsplit(url)._replace(path=path, query="", fragment="").geturl()
+
+def json_probes(url: str) -> List[Tuple[str, Callable]]:
+    """Non-WordPress endpoints that serve a portfolio as JSON behind the UI, in priority order."""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
+    # Squarespace keeps the page's own filters (?sector=ai) and adds format=json
+    query = parse_qsl(parts.query, keep_blank_values=True) + [("format", "json")]
+    return [
+        (_under(url, path + "/api/portfolio"), _parse_api_items),
+        (_under(url, path + "/api/companies"), _parse_api_items),
+        (parts._replace(query=urlencode(query), fragment="").geturl(), _parse_squarespace),
     ]
-    
-    for wp_api in wp_api_endpoints:
-        try:
-            if requests.head(wp_api, timeout=10).status_code == 200:
-                print("ℹ️  Using WordPress/API endpoint")
-                api_data = requests.get(wp_api, timeout=TIMEOUT).json()
-                for item in api_data:
-                    if isinstance(item, dict):
-                        name = ""
-                        website = ""
-                        
-                        # Try different field names for company name
-                        for name_field in ["title", "name", "company_name", "company"]:
-                            if name_field in item:
-                                if isinstance(item[name_field], dict) and "rendered" in item[name_field]:
-                                    name = item[name_field]["rendered"].strip()
-                                elif isinstance(item[name_field], str):
-                                    name = item[name_field].strip()
-                                break
-                        
-                        # Try different field names for website
-                        for url_field in ["website", "company_website", "url", "link", "acf"]:
-                            if url_field in item:
-                                if url_field == "acf" and isinstance(item[url_field], dict):
-                                    website = item[url_field].get("company_website", "")
-                                elif isinstance(item[url_field], str):
-                                    website = item[url_field]
-                                break
-                        
-                        if name and len(name) > 1:
-                            final_url = website or f"https://www.google.com/search?q={name.replace(' ', '+')}+company"
-                            rows.append((name, final_url))
-                
-                if rows:
-                    return rows
-        except Exception as e:
-            continue
+
+def _parser_for(endpoint: str) -> Callable:
+    squarespace = ("format", "json") in parse_qsl(urlsplit(endpoint).query)
+    return _parse_squarespace if squarespace else _parse_api_items
+
+WP_PER_PAGE = 100   # the REST API's maximum; its default of 10 truncates portfolios
+
+def _get_json(endpoint: str):
+    """GET *endpoint*; (parsed body, response) if it answered 200 with JSON, else (None, response).
+    The body is streamed, so a non-JSON answer (e.g. the HTML page) is never downloaded.
+    """
+    LIMITER.wait(endpoint)
+    resp = SESSION.get(endpoint, timeout=TIMEOUT, stream=True)
+    if resp.status_code != 200 or "json" not in resp.headers.get("Content-Type", ""):
+        resp.close()
+        return None, resp
+    return resp.json(), resp
+
+def _wp_page(url: str, parser: Callable) -> List[Tuple[str, str]]:
+    """Rows from one follow-up WP-JSON page; a page that fails only loses its own rows."""
+    try:
+        data, _ = _get_json(url)
+        return parser(data) if data else []
+    except Exception:
+        return []
+
+def probe_json(endpoint: str, parser: Callable) -> Optional[List[Tuple[str, str]]]:
+    """GET the endpoint and, if it answers with JSON, parse it. WordPress
+    collections are read a full page at a time, pages 2..X-WP-TotalPages at once.
+    Returns [] for a definite "no" (disallowed, 4xx/other non-200, not JSON) and
+    None when there was no real answer (timeout, connection error, 429/5xx after
+    retries, bad body).
+    """
+    try:
+        if not allowed(endpoint):
+            return []
+        if "/wp-json/" not in endpoint:
+            data, resp = _get_json(endpoint)
+        else:
+            data, resp = _get_json(f"{endpoint}?per_page={WP_PER_PAGE}&page=1")
+        if data is None:
+            # 429/5xx survived the session's retries: the server didn't really answer
+            return None if resp.status_code == 429 or resp.status_code >= 500 else []
+        rows = parser(data)
+        if "/wp-json/" not in endpoint:
+            return rows
+        # Page 1's headers give the page count, so the rest can be fetched side by side
+        total = min(int(resp.headers.get("X-WP-TotalPages") or 1), MAX_PAGES)
+        if total > 1:
+            urls = [f"{endpoint}?per_page={WP_PER_PAGE}&page={page}" for page in range(2, total + 1)]
+            with ThreadPoolExecutor(max_workers=min(len(urls), DETAIL_WORKERS)) as ex:
+                for page_rows in ex.map(lambda u: _wp_page(u, parser), urls):
+                    rows += page_rows
+        return rows
+    except Exception:
+        return None
+
+# ── master extractor ────────────────────────────────────────────────
+def extract_companies(url: str, browser: Optional[BrowserHost] = None) -> List[Tuple[str, str]]:
+    try:
+        return _extract_companies(url, browser)
+    finally:
+        flush_caches()  # one write per cache per run, however many entries it gained
+
+def _extract_companies(url: str, browser: Optional[BrowserHost]) -> List[Tuple[str, str]]:
+    vc_dom = _domain(url)
+    seen = set()
+
+    # Fetch + parse the listing in the background while the API probes run
+    ex = ThreadPoolExecutor(max_workers=1)
+    listing = ex.submit(fetch_tree, url)
+    ex.shutdown(wait=False)
+
+    # Try JSON endpoints first (WordPress REST, common /api routes, Squarespace);
+    # probe them all at once and take the first in priority order with rows.
+    # A remembered answer from an earlier run narrows (or skips) the probing.
+    known = API_CACHE.get(url)
+    if known is not None:
+        probes = [(known, _parser_for(known))] if known else []
+    else:
+        probes = json_probes(url)
+    if probes:
+        with ThreadPoolExecutor(max_workers=len(probes) + 2) as pool:
+            futs = [pool.submit(probe_json, *probe) for probe in probes]
+            if known is None:
+                # The generic probes are already out; WordPress is only probed once
+                # the listing confirms it (and says where its REST root is)
+                try:
+                    tree = listing.result()
+                except Exception:
+                    tree = None
+                wp = wp_probes(url, tree)
+                probes = wp + probes
+                futs = [pool.submit(probe_json, *probe) for probe in wp] + futs
+            results = [fut.result() for fut in futs]
+        for (endpoint, _), api_rows in zip(probes, results):
+            if api_rows:
+                print(f"ℹ️  Using WordPress/API endpoint {endpoint}")
+                API_CACHE.set(url, endpoint)
+                return api_rows
+        # Nothing answered: forget a stale remembered endpoint, or remember "no API",
+        # but only if every probe gave a definite answer; a flaky run (timeouts,
+        # 5xx after retries) mustn't hide the JSON path for a week
+        if known is not None:
+            API_CACHE.set(url, None)
+        elif None not in results:
+            API_CACHE.set(url, "")
 
     # Try basic HTML scraping first and store results as fallback
     html_rows = []
     anchor_rows = []  # capture exact links from anchor tags when available
+    detail_sites: Dict[str, str] = {}  # detail page -> website, reused by Playwright
     html_quality_companies = 0
     
     try:
-        soup = BeautifulSoup(fetch(url), "html.parser")
+        tree = listing.result()
+        anchors = tree.css("a[href]")
         
-        # 1️⃣  First, capture anchor tags that wrap portfolio cards (very precise for sites like Bling Capital)
-        for a in soup.find_all("a", href=True):
-            if a.find(class_="portfolio-card"):
-                href_raw = a["href"].strip()
-                if href_raw == "//":
-                    continue  # skip invalid
-                href = urljoin(url, normalize(html.unescape(href_raw)))
-                dom = tldextract.extract(href).domain.lower()
-                if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
-                    continue
+        # 1️⃣  One pass over the anchors. Anchors wrapping portfolio cards are very
+        #     precise (sites like Bling Capital) and go to anchor_rows; every other
+        #     external link is kept as a generic fallback, keyed by URL
+        generic: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for a in anchors:
+            href_raw = (a.attributes.get("href") or "").strip()
+            if href_raw == "//":
+                continue  # skip invalid
+            href = urljoin(url, normalize(html.unescape(href_raw)))
+            dom = _domain(href)
+            if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
+                continue
+            key = url_key(href)
+            if key not in seen and a.css_first(".portfolio-card"):
                 # Portfolio cards usually have an <h4> with the company name
-                h4 = a.find("h4")
-                name = h4.get_text(strip=True) if h4 else a.get_text(" ", strip=True)
-                name = re.sub(r"\s+", " ", name)
-                if name and len(name) <= 80 and href not in seen:
+                h4 = a.css_first("h4")
+                name = h4.text(strip=True) if h4 else a.text(separator=" ", strip=True)
+                name = _WS_RE.sub(" ", name)
+                if name and len(name) <= 80:
                     anchor_rows.append((name, href))
-                    seen.add(name)
+                    seen.add(key)
+                    continue
+            if key not in generic:
+                name = _WS_RE.sub(" ", a.text(separator=" ", strip=True)) or dom.capitalize()
+                if len(name) <= 100:
+                    generic[key] = (name, href)
 
-        # 2️⃣  Generic pass: Look for any external links that might be company websites (fallback)
-        for a in soup.find_all("a", href=True):
-            href = urljoin(url, normalize(html.unescape(a["href"])))
-            dom = tldextract.extract(href).domain.lower()
-            if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
-                continue
-            name = re.sub(r"\s+", " ", a.get_text(" ", strip=True)) or dom.capitalize()
-            if href in seen or len(name) > 100:
+        # 2️⃣  Generic links, minus the URLs a portfolio card already claimed
+        html_rows = [row for key, row in generic.items() if key not in seen]
+        seen.update(generic)
+
+        # 3️⃣  Cards that only link to an on-site detail page: resolve them all at once
+        found = {r[0].lower() for r in anchor_rows + html_rows}
+        detail_rows = []
+        for a in tree.css(ROW_SEL):
+            detail_url = urljoin(url, normalize(html.unescape((a.attributes.get("href") or "").strip())))
+            heading = a.css_first("h2, h3, h4")
+            name = _WS_RE.sub(" ", (heading or a).text(separator=" ", strip=True))
+            if (not name or len(name) > 80 or name.lower() in found
+                    or not _is_detail_url(detail_url, url)
+                    or _domain(detail_url) != vc_dom):
                 continue
-            seen.add(href)
-            html_rows.append((name, href))
+            found.add(name.lower())
+            detail_rows.append((name, detail_url))
+
+        if detail_rows:
+            detail_sites = resolve_company_urls([d for _, d in detail_rows])
+            for name, detail_url in detail_rows:
+                href = detail_sites[detail_url]
+                dom = _domain(href)
+                key = url_key(href)
+                if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS or key in seen:
+                    continue
+                seen.add(key)
+                anchor_rows.append((name, href))
+            print(f"ℹ️  Resolved {len(detail_rows)} portfolio detail pages")
 
         # Prefer anchor_rows if we found a decent amount (exact links)
         if len(anchor_rows) >= 5:
             print(f"ℹ️  Anchor-based extraction found {len(anchor_rows)} companies with exact URLs")
-            html_rows = anchor_rows + [row for row in html_rows if row[0] not in {r[0] for r in anchor_rows}]
+            anchor_names = {r[0] for r in anchor_rows}
+            html_rows = anchor_rows + [row for row in html_rows if row[0] not in anchor_names]
         else:
             print(f"ℹ️  Anchor-based extraction found only {len(anchor_rows)} companies; using generic links too")
+            html_rows = anchor_rows + html_rows
         
         print(f"ℹ️  Basic HTML extraction found {len(html_rows)} potential companies")
         
         # Analyze quality of HTML extraction results
         if len(html_rows) > 10:  # If we found a reasonable number
             # Count how many look like real company names (not navigation/UI)
-            for name, url in html_rows:
-                name_lower = name.lower()
-                # Skip obvious navigation/UI elements
-                if any(nav_word in name_lower for nav_word in [
-                    "home", "about", "team", "contact", "blog", "news", "portfolio", 
-                    "companies", "investment", "fund", "menu", "navigation"
-                ]):
-                    continue
-                # Skip very long descriptions
-                if len(name) > 50 or len(name.split()) > 5:
-                    continue
-                # Skip if it looks like a sentence or description
-                if any(word in name_lower for word in ["the", "and", "for", "with", "our", "we", "is", "are"]):
-                    continue
-                
-                html_quality_companies += 1
+            # (short, not navigation/UI, not a sentence or description; names are
+            # already single-spaced, so counting spaces counts words)
+            html_quality_companies = sum(
+                1 for name, _ in html_rows
+                if len(name) <= 50 and name.count(" ") < 5
+                and not _NAV_RE.search(name) and not _STOP_RE.search(name)
+            )
             
             print(f"ℹ️  Quality company names found: {html_quality_companies}")
             
             # Special handling for sites that claim to have many more companies
             # Look for indicators that there's more content (like pagination or "1000+" mentions)
-            soup_text = soup.get_text().lower()
-            has_large_portfolio_indicators = any(indicator in soup_text for indicator in [
+            page_text = tree.text().lower()
+            has_large_portfolio_indicators = any(indicator in page_text for indicator in [
                 "1000", "1,000", "1400", "1,400", "500+", "1000+", "1,000+", 
                 "over 1000", "over 1,000", "thousand", "hundreds of companies",
                 "view all", "show all", "load more", "see all portfolio"
             ])
             
-            has_pagination = soup.select_one("a[class*='next'], button[class*='next'], .pagination")
+            has_pagination = tree.css_first("a[class*='next'], button[class*='next'], .pagination")
             
             # If we found quality companies BUT there are indicators of much more content,
             # use Playwright to get the full dataset, but compare results
             if html_quality_companies >= 15 and (has_large_portfolio_indicators or has_pagination):
                 print("ℹ️  Detected potential for more content - testing Playwright extraction")
-                playwright_results = extract_with_playwright(url)
+                playwright_results = extract_with_playwright(url, browser, detail_sites)
                 
                 # Compare results and use the better one
                 if playwright_results and len(playwright_results) > len(html_rows) * 1.2:  # Playwright found 20% more
@@ -424,7 +1222,7 @@ def extract_companies(url: str) -> List[Tuple[str, str]]:
 
     # Fall back to Playwright extraction, but use HTML results if Playwright fails
     print("ℹ️  Using Playwright extraction")
-    playwright_results = extract_with_playwright(url)
+    playwright_results = extract_with_playwright(url, browser, detail_sites)
     
     # If Playwright failed but we have HTML results, use those as fallback
     if not playwright_results and html_rows:
@@ -437,6 +1235,19 @@ def extract_companies(url: str) -> List[Tuple[str, str]]:
         print("⚠️  Both Playwright and HTML extraction failed")
         return []
 
+# ── CSV output ──────────────────────────────────────────────────────
+def write_csv(rows: Iterable[Tuple[str, str]], f) -> None:
+    """Stream rows, after a header, into an open text file without copying them."""
+    w = csv.writer(f)
+    w.writerow(("Company", "URL"))
+    w.writerows(rows)
+
+def to_csv_bytes(rows: Iterable[Tuple[str, str]]) -> bytes:
+    """Encode rows as a UTF-8 CSV with a header, in one buffer and one encode."""
+    buff = io.StringIO()
+    write_csv(rows, buff)
+    return buff.getvalue().encode("utf-8")
+
 # ── CLI wrapper ─────────────────────────────────────────────────────
 def main() -> None:
     import sys
@@ -447,8 +1258,8 @@ def main() -> None:
     data = extract_companies(target)
 
     out = Path("portfolio_companies.csv")
-    with out.open("w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerows([("Company", "URL"), *data])
+    with out.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        write_csv(data, f)
 
     print(f"✅  {len(data)} companies saved to {out}")
 